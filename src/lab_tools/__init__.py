@@ -1,6 +1,6 @@
 from .config import Formatters, Locators, AxesUtils, Norms, SI, LoggerFactory
 from .curve_fit import CurveFit
-from .file_io import PICKLE, JSON, TXT
+from .file_io import PICKLE, JSON, TXT, MSGPACK, NPY
 from .linear_regression import LinearRegression
 from . import wave
 from . import typing
@@ -16,6 +16,8 @@ __all__ = [
     "PICKLE",
     "JSON",
     "TXT",
+    "MSGPACK",
+    "NPY",
     "LinearRegression",
     "wave",
     "typing",
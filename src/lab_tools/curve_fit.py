@@ -1,5 +1,5 @@
 from collections.abc import Iterator
-from typing import Callable, Self
+from typing import Callable, Literal, Self
 import warnings
 import numpy as np
 from numpy.typing import ArrayLike
@@ -11,6 +11,7 @@ from scipy.optimize import fsolve
 
 
 class CurveFit:
+    _UNIT_100 = np.linspace(0.0, 1.0, 100)
 
     def __init__(
         self,
@@ -21,6 +22,11 @@ class CurveFit:
         limits: ArrayLike | None = None,
         p0: ArrayLike | None = None,
         bounds: tuple[ArrayLike, ArrayLike] | None = None,
+        method: Literal["lm", "trf", "dogbox"] | None = None,
+        ftol: float = 1e-8,
+        xtol: float = 1e-8,
+        x_scale: ArrayLike | Literal["jac"] = "jac",
+        silent: bool = False,
     ) -> None:
         """
         Initialize the FitCurve class with the function to fit and data
@@ -39,26 +45,56 @@ class CurveFit:
             The initial guess for the parameters, by default None
         bounds : tuple[ArrayLike, ArrayLike] | None, optional
             The bounds for the parameters, by default None
+        method : Literal["lm", "trf", "dogbox"] | None, optional
+            The optimization method passed to scipy's curve_fit, by default None
+            ("lm" without bounds, "trf" with bounds)
+        ftol : float, optional
+            Relative tolerance for the change of the cost function, by default 1e-8
+        xtol : float, optional
+            Relative tolerance for the change of the parameters, by default 1e-8
+        x_scale : ArrayLike | Literal["jac"], optional
+            Characteristic scale of each parameter, ignored by "lm", by default "jac"
+        silent : bool, optional
+            Whether to suppress the warning emitted when fitting fails, by default False.
+            Without it, each instance warns on its first failed fit only
         """
         self.fun = fun
-        self.x = np.asarray(x, dtype=float64)
-        self.y = np.asarray(y, dtype=float64)
+        self.x, self.y = Validate.xy_arrays(x, y)
         self.p0 = p0
         self.bounds = bounds
+        self.method = method
+        self.ftol = ftol
+        self.xtol = xtol
+        self.x_scale = x_scale
+        self.silent = silent
         self.fitted = False
+        self._warned = False
 
-        Validate.is_1d_array(self.x)
-        Validate.is_1d_array(self.y)
-        Validate.arrays_same_length(self.x, self.y)
         if limits is not None:
             Validate.limits_type(limits)
             self.limits = tuple(np.asarray(limits))
         else:
             self.limits = (self.x.min(), self.x.max())
 
+        self._result: np.ndarray[tuple[int], dtype[float64]] | None = None
         self._params: np.ndarray[tuple[int], dtype[float64]] | None = None
+        self._stderr: np.ndarray[tuple[int], dtype[float64]] | None = None
         self._covariance: np.ndarray[tuple[int, int], dtype[float64]] | None = None
         self._r2: float | None = None
+        self._x_fit: np.ndarray[tuple[int], dtype[float64]] | None = None
+        self._y_fit: np.ndarray[tuple[int], dtype[float64]] | None = None
+
+    def _allocate_result(self, n: int) -> None:
+        """
+        Allocate one contiguous buffer laid out as [params, stderr, covariance]
+        and bind the public result attributes as views into it. A fresh buffer
+        is allocated on every fit so arrays returned by earlier fits are never
+        overwritten
+        """
+        self._result = np.empty(2 * n + n * n, dtype=float64)
+        self._params = self._result[:n]
+        self._stderr = self._result[n : 2 * n]
+        self._covariance = self._result[2 * n :].reshape(n, n)
 
     @property
     def params(self) -> ndarray[tuple[int], dtype[float64]]:
@@ -84,6 +120,31 @@ class CurveFit:
             raise NotFittedError("Model is not fitted yet")
         return self._covariance
 
+    @property
+    def x_fit(self) -> ndarray[tuple[int], dtype[float64]]:
+        if self._x_fit is not None:
+            return self._x_fit
+        lo, hi = self.limits
+        x_fit = lo + (hi - lo) * CurveFit._UNIT_100
+        x_fit[-1] = hi
+        return x_fit
+
+    @x_fit.setter
+    def x_fit(self, value: ArrayLike) -> None:
+        self._x_fit = np.asarray(value, dtype=float64)
+
+    @property
+    def y_fit(self) -> ndarray[tuple[int], dtype[float64]]:
+        if self._y_fit is not None:
+            return self._y_fit
+        if not self.fitted or self._params is None:
+            raise NotFittedError()
+        return np.asarray(self.fun(self.x_fit, *self._params), dtype=float64)
+
+    @y_fit.setter
+    def y_fit(self, value: ArrayLike) -> None:
+        self._y_fit = np.asarray(value, dtype=float64)
+
     def fit(self) -> Self:
         """
         Perform the curve fitting process using scipy's curve_fit and calculate the optimal parameters, their uncertainties, and the coefficient of determination (R²)
@@ -98,30 +159,41 @@ class CurveFit:
         NotFittedError
             If the fitting process fails
         """
+        method = self.method
+        if method is None:
+            method = "lm" if self.bounds is None else "trf"
+        kwargs = {} if method == "lm" else {"x_scale": self.x_scale}
+        self._x_fit = self._y_fit = None
         try:
-            self._params, self._covariance = curve_fit(
+            params, covariance = curve_fit(
                 self.fun,
                 self.x,
                 self.y,
                 p0=self.p0,
                 bounds=self.bounds if self.bounds is not None else (-np.inf, np.inf),
+                method=method,
+                ftol=self.ftol,
+                xtol=self.xtol,
+                **kwargs,
             )
-            if self._params is None or self._covariance is None:
+            if params is None or covariance is None:
                 raise NotFittedError()
-            self._stderr = np.sqrt(np.diag(self._covariance))
-            self.x_fit = np.linspace(self.limits[0], self.limits[1], 100)
-            self.y_fit = self.fun(self.x_fit, *self._params)
+            self._allocate_result(len(params))
+            assert self._params is not None and self._covariance is not None
+            self._params[:] = params
+            self._covariance[:] = covariance
+            np.sqrt(np.diag(covariance), out=self._stderr)
             y_pred = self.fun(self.x, *self._params)
-            ss_res = np.sum((self.y - y_pred) ** 2)
-            ss_tot = np.sum((self.y - np.mean(self.y)) ** 2)
+            residuals = self.y - y_pred
+            centered = self.y - np.mean(self.y)
+            ss_res = residuals @ residuals
+            ss_tot = centered @ centered
             self._r2 = 1 - (ss_res / ss_tot if ss_tot != 0 else 0)
             self.fitted = True
         except (RuntimeError, OptimizeWarning) as e:
-            warnings.warn(f"Curve fitting failed: {e}")
-            n_params = self.fun.__code__.co_argcount - 1
-            self._params = np.full(n_params, np.nan)
-            self._covariance = np.full((n_params, n_params), np.nan)
-            self._stderr = np.full(n_params, np.nan)
+            if not self.silent and not self._warned:
+                self._warned = True
+                warnings.warn(f"Curve fitting failed: {e}")
             self._r2 = np.nan
             self.fitted = False
 
@@ -191,15 +263,12 @@ class CurveFit:
     def __iter__(self) -> Iterator[float]:
         if (
             not self.fitted
+            or self._result is None
             or self._params is None
-            or self._stderr is None
             or self._r2 is None
         ):
             raise NotFittedError()
-        for arg in self._params:
-            yield arg
-        for err in self._stderr:
-            yield err
+        yield from self._result[: 2 * len(self._params)]
         yield self._r2
 
     def __str__(self) -> str:
@@ -1,29 +1,45 @@
-from abc import ABC, abstractmethod
 import json
 import pickle
-from typing import Any
+import re
+from typing import Any, Protocol
 
+import numpy as np
+from numpy import ndarray
+from numpy.typing import ArrayLike
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from .typing import FileDescriptorOrPath
 from .validate import Validate
 
 
-class FileIO(ABC):
+class FileIO(Protocol):
     @classmethod
-    @abstractmethod
     def dump(cls, file: FileDescriptorOrPath, data: Any) -> None: ...
 
     @classmethod
-    @abstractmethod
     def load(cls, file: FileDescriptorOrPath) -> Any: ...
 
 
-class PICKLE(FileIO):
+class PICKLE:
     @classmethod
     def dump(cls, file: FileDescriptorOrPath, data: Any) -> None:
         Validate.file_extension(file, ".pkl")
         with open(file, "wb") as f:
-            pickle.dump(data, f)
+            pickle.Pickler(f, protocol=5).dump(data)
 
     @classmethod
     def load(cls, file: FileDescriptorOrPath) -> Any:
@@ -32,7 +48,26 @@ class PICKLE(FileIO):
             return pickle.load(f)
 
 
-class JSON(FileIO):
+class JSON:
+    _LONG_DIGITS = re.compile(rb"\d{19}")
+    _SCALARS = (str, int, float, type(None))
+
+    @classmethod
+    def _plain(cls, data: Any) -> bool:
+        """
+        Check that data only holds types the stdlib json module serializes
+        natively. ujson would stringify other keys and coerce e.g. Decimal
+        to float, where json raises TypeError
+        """
+        if isinstance(data, dict):
+            return all(
+                isinstance(key, cls._SCALARS) and cls._plain(value)
+                for key, value in data.items()
+            )
+        if isinstance(data, (list, tuple)):
+            return all(cls._plain(value) for value in data)
+        return isinstance(data, cls._SCALARS)
+
     @classmethod
     def dump(cls, file: FileDescriptorOrPath, data: dict[Any, Any]) -> None:
         if not isinstance(data, dict):
@@ -41,16 +76,33 @@ class JSON(FileIO):
             )
         Validate.file_extension(file, ".json")
         with open(file, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+            if ujson is not None and cls._plain(data):
+                f.write(ujson.dumps(data, escape_forward_slashes=False))
+            else:
+                json.dump(data, f)
 
     @classmethod
     def load(cls, file: FileDescriptorOrPath) -> dict[Any, Any]:
         Validate.file_extension(file, ".json")
+        if orjson is not None:
+            with open(file, "rb") as f:
+                raw = f.read()
+            # orjson parses integers beyond 64 bits as floats, leave any long
+            # digit run to the stdlib parser
+            if cls._LONG_DIGITS.search(raw) is None:
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # e.g. NaN/Infinity literals, which orjson rejects
+                    pass
+            return json.loads(raw)
         with open(file, "r", encoding="utf-8") as f:
+            if ujson is not None:
+                return ujson.loads(f.read())
             return json.load(f)
 
 
-class TXT(FileIO):
+class TXT:
     @classmethod
     def dump(cls, file: FileDescriptorOrPath, data: str) -> None:
         if not isinstance(data, str):
@@ -58,11 +110,46 @@ class TXT(FileIO):
                 f"Invalid data type: expected str, but got {type(data).__name__}."
             )
         Validate.file_extension(file, ".txt")
-        with open(file, "w", encoding="utf-8") as f:
-            f.write(data)
+        with open(file, "wb") as f:
+            f.write(data.encode("utf-8"))
 
     @classmethod
     def load(cls, file: FileDescriptorOrPath) -> str:
         Validate.file_extension(file, ".txt")
-        with open(file, "r", encoding="utf-8") as f:
-            return f.read()
+        with open(file, "rb") as f:
+            text = f.read().decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+
+class MSGPACK:
+    @classmethod
+    def dump(cls, file: FileDescriptorOrPath, data: Any) -> None:
+        if msgpack is None:
+            raise ImportError("MSGPACK requires the optional 'msgpack' package")
+        Validate.file_extension(file, ".msgpack")
+        with open(file, "wb") as f:
+            f.write(msgpack.packb(data, use_bin_type=True))
+
+    @classmethod
+    def load(cls, file: FileDescriptorOrPath) -> Any:
+        if msgpack is None:
+            raise ImportError("MSGPACK requires the optional 'msgpack' package")
+        Validate.file_extension(file, ".msgpack")
+        with open(file, "rb") as f:
+            return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+
+
+class NPY:
+    @classmethod
+    def dump(cls, file: FileDescriptorOrPath, data: ArrayLike) -> None:
+        Validate.file_extension(file, ".npy")
+        with open(file, "wb") as f:
+            np.save(f, np.asarray(data), allow_pickle=False)
+
+    @classmethod
+    def load(cls, file: FileDescriptorOrPath) -> ndarray:
+        Validate.file_extension(file, ".npy")
+        with open(file, "rb") as f:
+            return np.load(f, allow_pickle=False)
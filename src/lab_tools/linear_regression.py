@@ -1,3 +1,4 @@
+import math
 from typing import Iterator, Self
 from numpy.typing import ArrayLike
 import numpy as np
@@ -8,7 +9,90 @@ from .exceptions import NotFittedError
 from .validate import Validate
 
 
+def _rowdot(a: ndarray, b: ndarray) -> ndarray | float64:
+    if a.ndim == 1:
+        return a @ b
+    return np.einsum("...i,...i->...", a, b)
+
+
+# Relative size below which a one-pass centered or residual sum has lost too
+# many digits to cancellation and is recomputed from explicit differences
+_CANCELLATION_RTOL = 1e-6
+
+
+def _ols_kernel(
+    x: ndarray[tuple[int, ...], dtype[float64]],
+    y: ndarray[tuple[int, ...], dtype[float64]],
+    force_zero: bool,
+) -> tuple[ndarray | float64, ...]:
+    """
+    Ordinary least squares fit along the last axis, reduced to the five sums
+    Σx, Σy, Σx², Σy², Σxy
+
+    Returns
+    -------
+    tuple[ndarray | float64, ...]
+        slope, intercept, stderr, intercept_stderr, rvalue
+    """
+    n = x.shape[-1]
+    sqrt = math.sqrt if x.ndim == 1 else np.sqrt
+    sxx = _rowdot(x, x)
+    syy = _rowdot(y, y)
+    sxy = _rowdot(x, y)
+
+    if force_zero:
+        slope = sxy / sxx
+        intercept = np.zeros_like(slope)
+        ss_res = syy - slope * sxy
+        if np.any(ss_res <= _CANCELLATION_RTOL * syy):
+            # near-perfect fit: take the residual sum from explicit residuals
+            residuals = y - np.expand_dims(slope, -1) * x
+            ss_res = _rowdot(residuals, residuals)
+        sigma2 = np.maximum(ss_res, 0.0) / (n - 1)
+        stderr = sqrt(sigma2 / sxx)
+        intercept_stderr = np.zeros_like(slope)
+        rvalue = sxy / sqrt(sxx * syy)
+    else:
+        sx = x.sum(axis=-1)
+        sy = y.sum(axis=-1)
+        x_mean = sx / n
+        S_xx_c = sxx - sx * x_mean
+        S_yy_c = syy - sy * sy / n
+        S_xy_c = sxy - sx * sy / n
+        if np.any(S_xx_c <= _CANCELLATION_RTOL * sxx) or np.any(
+            S_yy_c <= _CANCELLATION_RTOL * syy
+        ):
+            # mean dominates the spread: fall back to a two-pass centered sum
+            xc = x - np.expand_dims(x_mean, -1)
+            yc = y - np.expand_dims(sy / n, -1)
+            S_xx_c = _rowdot(xc, xc)
+            S_yy_c = _rowdot(yc, yc)
+            S_xy_c = _rowdot(xc, yc)
+        S_xx_c = np.maximum(S_xx_c, 0.0)
+        S_yy_c = np.maximum(S_yy_c, 0.0)
+        slope = S_xy_c / S_xx_c
+        intercept = (sy - slope * sx) / n
+        ss_res = S_yy_c - slope * S_xy_c
+        if np.any(ss_res <= _CANCELLATION_RTOL * S_yy_c):
+            # near-perfect fit: take the residual sum from explicit residuals
+            residuals = (
+                y
+                - np.expand_dims(slope, -1) * x
+                - np.expand_dims(intercept, -1)
+            )
+            ss_res = _rowdot(residuals, residuals)
+        sigma2 = np.maximum(ss_res, 0.0) / (n - 2)
+        stderr = sqrt(sigma2 / S_xx_c)
+        intercept_stderr = sqrt(sigma2 * (1 / n + x_mean**2 / S_xx_c))
+        rvalue = S_xy_c / sqrt(S_xx_c * S_yy_c)
+    # rounding can push |r| of (near) exactly linear data just above 1
+    rvalue = np.clip(rvalue, -1.0, 1.0)
+
+    return slope, intercept, stderr, intercept_stderr, rvalue
+
+
 class LinearRegression:
+    _UNIT_50 = np.linspace(0.0, 1.0, 50)
 
     def __init__(
         self,
@@ -41,15 +125,10 @@ class LinearRegression:
         ValueError
             If limits is wrong type
         """
-        self.x = np.asarray(x, dtype=float64)
-        self.y = np.asarray(y, dtype=float64)
+        self.x, self.y = Validate.xy_arrays(x, y)
         self.force_zero = force_zero
         self.fitted = False
 
-        Validate.is_1d_array(self.x)
-        Validate.is_1d_array(self.y)
-        Validate.arrays_same_length(self.x, self.y)
-
         if limits is not None:
             Validate.limits_type(limits)
             self.limits = tuple(np.asarray(limits))
@@ -61,55 +140,104 @@ class LinearRegression:
         self.rvalue: float = 0.0
         self.stderr: float = 0.0
         self.intercept_stderr: float = 0.0
+        self._inv_slope: float = math.nan
+
+        self._df_cache: pd.DataFrame | None = None
 
     def fit(self) -> Self:
         """
         Fits the linear regression model using the provided X and Y data
         """
-        self.slope: float = 0.0
-        self.intercept: float = 0.0
-        self.stderr: float = 0.0
-        self.intercept_stderr: float = 0.0
-
-        n = len(self.x)
-        if self.force_zero:
-            S_xx = np.sum(self.x**2)
-            self.slope = np.sum(self.x * self.y) / S_xx
-            self.intercept = 0.0
-            y_fit = self.slope * self.x
-            sigma2 = np.sum((self.y - y_fit) ** 2) / (n - 1)
-            self.stderr = np.sqrt(sigma2 / S_xx)
-            self.intercept_stderr = 0.0
-        else:
-            x_mean = np.mean(self.x, dtype=float64)
-            y_mean = np.mean(self.y, dtype=float64)
-            S_xx = np.sum((self.x - x_mean) ** 2)
-            self.slope = np.sum((self.x - x_mean) * (self.y - y_mean)) / S_xx
-            self.intercept = y_mean - self.slope * x_mean
-            y_fit = self.slope * self.x + self.intercept
-            sigma2 = np.sum((self.y - y_fit) ** 2) / (n - 2)
-            self.stderr = np.sqrt(sigma2 / S_xx)
-            self.intercept_stderr = np.sqrt(sigma2 * (1 / n + x_mean**2 / S_xx))
-        self.rvalue = np.corrcoef(self.x, self.y)[0, 1]
-
-        self.x_fit = np.linspace(self.limits[0], self.limits[1], dtype=float64)
-        self.y_fit = self.slope * self.x_fit + self.intercept
+        (
+            self.slope,
+            self.intercept,
+            self.stderr,
+            self.intercept_stderr,
+            self.rvalue,
+        ) = map(
+            float,
+            _ols_kernel(self.x, self.y, self.force_zero),
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._inv_slope = float(np.float64(1.0) / self.slope)
+
+        lo, hi = self.limits
+        self.x_fit = lo + (hi - lo) * LinearRegression._UNIT_50
+        self.x_fit[-1] = hi
+        self.y_fit = np.multiply(self.x_fit, self.slope)
+        self.y_fit += self.intercept
+        self._df_cache = None
         self.fitted = True
         return self
 
-    def predict_y(self, x: ArrayLike) -> ndarray[tuple[int], dtype[float64]]:
+    @classmethod
+    def fit_many(
+        cls,
+        X: ArrayLike,
+        Y: ArrayLike,
+        *,
+        force_zero: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Fit one linear regression per row of X and Y in a single vectorized pass
+
+        Parameters
+        ----------
+        X : ArrayLike
+            2D array of x values with shape (n_trials, n_points)
+        Y : ArrayLike
+            2D array of y values with shape (n_trials, n_points)
+        force_zero : bool, optional
+            Wether to force intercept to be zero, by default False
+
+        Returns
+        -------
+        DataFrame
+            DataFrame with one row per trial and columns slope, intercept,
+            stderr, intercept_stderr and rvalue
+
+        Raises
+        ------
+        ValueError
+            If inputted arrays are not 2D or have different shapes
+        """
+        X = np.asarray(X, dtype=float64)
+        Y = np.asarray(Y, dtype=float64)
+        if X.ndim != 2 or Y.ndim != 2:
+            raise ValueError("Input arrays must be two-dimensional")
+        if X.shape != Y.shape:
+            raise ValueError("Input arrays must have the same shape")
+
+        slope, intercept, stderr, intercept_stderr, rvalue = _ols_kernel(
+            X, Y, force_zero
+        )
+
+        return pd.DataFrame(
+            {
+                "slope": slope,
+                "intercept": intercept,
+                "stderr": stderr,
+                "intercept_stderr": intercept_stderr,
+                "rvalue": rvalue,
+            },
+            dtype=np.float64,
+        )
+
+    def predict_y(
+        self, x: ArrayLike | float
+    ) -> ndarray[tuple[int], dtype[float64]] | float:
         """
         Predicts the y value for a given x using the fitted linear regression model
 
         Parameters
         ----------
-        x : ArrayLike
+        x : ArrayLike | float
             The x value(s) for which to predict the corresponding y value(s)
 
         Returns
         -------
-        ndarray[tuple[int], dtype[float64]]
-            The predicted y value(s) for the given x
+        ndarray[tuple[int], dtype[float64]] | float
+            The predicted y value(s) for the given x, a float for scalar input
 
         Raises
         ------
@@ -118,26 +246,30 @@ class LinearRegression:
         """
         if not self.fitted:
             raise NotFittedError()
-        x = np.asarray(x)
         if self.slope == 0.0 and self.intercept == 0.0:
             raise ValueError("Model parameters are ambiguous")
+        if isinstance(x, (int, float)):
+            return self.slope * x + self.intercept
 
+        x = np.asarray(x)
         y = self.slope * x + self.intercept
         return y
 
-    def predict_x(self, y: ArrayLike) -> ndarray[tuple[int], dtype[float64]]:
+    def predict_x(
+        self, y: ArrayLike | float
+    ) -> ndarray[tuple[int], dtype[float64]] | float:
         """
         Predicts the x value for a given y using the fitted linear regression model
 
         Parameters
         ----------
-        y : ArrayLike
+        y : ArrayLike | float
             The y value(s) for which to predict the corresponding x value(s)
 
         Returns
         -------
-        ndarray[tuple[int], dtype[float64]]
-            The predicted x value(s) for the given y
+        ndarray[tuple[int], dtype[float64]] | float
+            The predicted x value(s) for the given y, a float for scalar input
 
         Raises
         ------
@@ -146,11 +278,13 @@ class LinearRegression:
         """
         if not self.fitted:
             raise NotFittedError
-        y = np.asarray(y)
         if self.slope == 0.0 and self.intercept == 0.0:
             raise ValueError("Model parameters are ambiguous")
+        if isinstance(y, (int, float)):
+            return (y - self.intercept) * self._inv_slope
 
-        x = (y - self.intercept) / self.slope
+        y = np.asarray(y)
+        x = (y - self.intercept) * self._inv_slope
         return x
 
     def __str__(self) -> str:
@@ -172,15 +306,23 @@ class LinearRegression:
     __repr__ = __str__
 
     def __iter__(self) -> Iterator[float]:
-        yield self.slope
-        yield self.intercept
-        yield self.stderr
-        yield self.intercept_stderr
-        yield self.rvalue
+        return iter(
+            (
+                self.slope,
+                self.intercept,
+                self.stderr,
+                self.intercept_stderr,
+                self.rvalue,
+            )
+        )
+
+    def __len__(self) -> int:
+        return 5
 
     def to_dataframe(self) -> pd.DataFrame:
         """
-        Convert the linear regression parameters to a pandas DataFrame
+        Convert the linear regression parameters to a pandas DataFrame.
+        The frame is cached until the next `fit()`, copy it before modifying
 
         Returns
         -------
@@ -189,6 +331,8 @@ class LinearRegression:
         """
         if not self.fitted:
             raise NotFittedError
+        if self._df_cache is not None:
+            return self._df_cache
         a = float(self.slope)
         ua = float(self.stderr)
         b = float(self.intercept)
@@ -196,7 +340,7 @@ class LinearRegression:
         rval = float(self.rvalue)
         r2 = float(self.rvalue**2)
 
-        return pd.DataFrame(
+        self._df_cache = pd.DataFrame(
             {
                 "slope": [a, ua],
                 "intercept": [b, ub],
@@ -206,6 +350,7 @@ class LinearRegression:
             index=["x", "u_x"],
             dtype=np.float64,
         )
+        return self._df_cache
 
 
 def main():
@@ -1,4 +1,7 @@
+import os
+
 import numpy as np
+from numpy import dtype, float64, ndarray
 from numpy.typing import ArrayLike
 
 from .typing import FileDescriptorOrPath
@@ -7,24 +10,63 @@ from .typing import FileDescriptorOrPath
 class Validate:
     @staticmethod
     def limits_type(limits: ArrayLike) -> None:
-        arr = np.asarray(limits)
+        arr = limits if isinstance(limits, np.ndarray) else np.asarray(limits)
 
-        if not np.issubdtype(arr.dtype, np.number) or arr.size != 2:
+        if arr.shape != (2,) or arr.dtype.kind not in "fiu":
             raise ValueError("Limits must be a sequence of two numeric values")
 
     @staticmethod
     def is_1d_array(arr: ArrayLike):
-        arr = np.asarray(arr)
+        if not isinstance(arr, np.ndarray):
+            arr = np.asarray(arr)
         if arr.ndim != 1:
             raise ValueError("Input arrays must be one-dimensional")
 
     @staticmethod
     def arrays_same_length(arr1: ArrayLike, arr2: ArrayLike):
-        arr1 = np.asarray(arr1)
-        arr2 = np.asarray(arr2)
+        if not (hasattr(arr1, "__len__") and hasattr(arr2, "__len__")):
+            arr1 = np.asarray(arr1)
+            arr2 = np.asarray(arr2)
         if len(arr1) != len(arr2):
             raise ValueError("Input arrays must have the same length")
 
+    @staticmethod
+    def xy_arrays(
+        x: ArrayLike, y: ArrayLike
+    ) -> tuple[
+        ndarray[tuple[int], dtype[float64]], ndarray[tuple[int], dtype[float64]]
+    ]:
+        """
+        Convert x and y to C-contiguous float64 arrays and check that both are
+        1D and of the same length, in a single pass over their metadata
+
+        Parameters
+        ----------
+        x : ArrayLike
+            Array of x values
+        y : ArrayLike
+            Array of y values
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            The converted x and y arrays
+
+        Raises
+        ------
+        ValueError
+            If either array is not 1D
+        ValueError
+            If the arrays are not the same length
+        """
+        xa = np.asarray(x, dtype=float64, order="C")
+        ya = np.asarray(y, dtype=float64, order="C")
+        if xa.ndim != 1 or ya.ndim != 1:
+            raise ValueError("Input arrays must be one-dimensional")
+        if xa.shape[0] != ya.shape[0]:
+            raise ValueError("Input arrays must have the same length")
+        return xa, ya
+
     @staticmethod
     def file_extension(file: FileDescriptorOrPath, expected_ext: str) -> None:
         if isinstance(file, int):
@@ -33,15 +75,11 @@ class Validate:
         if not expected_ext.startswith("."):
             raise ValueError("expected_ext must start with '.' (e.g. '.csv')")
 
-        file_str = str(file).lower()
+        path = os.fsdecode(file)
         expected_ext = expected_ext.lower()
 
-        if not file_str.endswith(expected_ext):
-            ext = (
-                "." + file_str.rsplit(".", 1)[-1]
-                if "." in file_str
-                else "<no extension>"
-            )
+        if path[-len(expected_ext) :].lower() != expected_ext:
+            ext = os.path.splitext(path)[1].lower() or "<no extension>"
             raise ValueError(
                 f"Invalid file type: expected '{expected_ext}', got '{ext}'"
             )
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def simple_linear_data(tmp_path_factory):
+    path = tmp_path_factory.getbasetemp() / "simple_linear_data.npy"
+    if not path.exists():
+        rng = np.random.RandomState(0)  # same stream as np.random.seed(0)
+        x = np.linspace(-10, 10, 50)
+        y = 3.0 * x + 2.0 + rng.normal(scale=0.5, size=len(x))
+        np.save(path, np.stack([x, y]))
+    data = np.load(path, mmap_mode="r")
+    return data[0], data[1]
@@ -0,0 +1,38 @@
+"""
+Record with ``pytest --benchmark-only --benchmark-autosave``, deselect with
+``-m "not benchmark"``
+"""
+
+import numpy as np
+import pytest
+
+from lab_tools.curve_fit import CurveFit
+from lab_tools.linear_regression import LinearRegression
+
+
+def exp_decay(x, a, k):
+    return a * np.exp(-k * x)
+
+
+@pytest.mark.benchmark(group="linear_regression")
+def test_linear_regression_fit_benchmark(benchmark, simple_linear_data):
+    x, y = simple_linear_data
+    reg = benchmark(lambda: LinearRegression(x, y).fit())
+    assert reg.fitted
+
+
+@pytest.mark.benchmark(group="linear_regression")
+def test_linear_regression_fit_many_benchmark(benchmark, simple_linear_data):
+    x, y = simple_linear_data
+    X = np.tile(x, (1000, 1))
+    Y = np.tile(y, (1000, 1))
+    df = benchmark(LinearRegression.fit_many, X, Y)
+    assert len(df) == 1000
+
+
+@pytest.mark.benchmark(group="curve_fit")
+def test_curve_fit_benchmark(benchmark):
+    x = np.linspace(0.0, 5.0, 200)
+    y = exp_decay(x, 2.0, 0.7)
+    cf = benchmark(lambda: CurveFit(exp_decay, x, y, p0=[1.0, 1.0]).fit())
+    assert np.allclose(cf.params, [2.0, 0.7], atol=1e-6)
@@ -1,4 +1,5 @@
 import pytest
+import warnings
 import numpy as np
 from lab_tools.curve_fit import CurveFit
 from lab_tools.exceptions import NotFittedError
@@ -209,3 +210,115 @@ class TestCurveFit:
         y = np.array([2, 4, 6])
         cf = CurveFit(linear_func, x, y)
         assert cf.limits == (1.0, 3.0)  # Min i max z x
+
+    def test_fit_grid(self):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([2, 4, 6, 8])
+        cf = CurveFit(linear_func, x, y, limits=(0.0, 5.0))
+        assert np.allclose(cf.x_fit, np.linspace(0.0, 5.0, 100))
+        with pytest.raises(NotFittedError):
+            _ = cf.y_fit
+        cf.fit()
+        assert np.allclose(cf.y_fit, 2.0 * cf.x_fit, atol=1e-8)
+
+    def test_fit_grid_endpoints(self):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([2, 4, 6, 8])
+        rng = np.random.default_rng(0)
+        for lo, hi in rng.uniform(-1e3, 1e3, size=(200, 2)):
+            x_fit = CurveFit(linear_func, x, y, limits=(lo, hi)).x_fit
+            assert x_fit[0] == lo and x_fit[-1] == hi
+
+    def test_fit_grid_assignable(self):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([2, 4, 6, 8])
+        cf = CurveFit(linear_func, x, y).fit()
+        cf.x_fit = [0.0, 10.0]
+        assert np.allclose(cf.y_fit, [0.0, 20.0], atol=1e-8)
+        cf.fit()
+        assert cf.x_fit.shape == (100,)
+
+    @pytest.mark.parametrize("method", ["lm", "trf", "dogbox"])
+    def test_fit_methods(self, method):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([3, 5, 7, 9])
+        cf = CurveFit(linear_func, x, y, method=method)
+        cf.fit()
+        assert cf.fitted
+        assert np.allclose(cf.params, [2.0, 1.0], atol=1e-6)
+
+    def test_fit_default_method_non_finite_at_p0(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        cf = CurveFit(lambda x, a, b: a * np.log(x - b), x, 2 * np.log(x + 0.5))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cf.fit()
+        assert cf.method is None
+        assert cf.fitted
+
+    def test_fit_varargs_model(self):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([1, 4, 9, 16])
+        cf = CurveFit(lambda x, *p: p[0] * x**2 + p[1] * x + p[2], x, y, p0=[1, 1, 1])
+        cf.fit()
+        assert cf.covariance.shape == (3, 3)
+        assert np.allclose(cf.params, [1.0, 0.0, 0.0], atol=1e-6)
+
+    def test_fit_uninspectable_model(self):
+        class Model:
+            __signature__ = "not a signature"
+
+            def __call__(self, x, a, b):
+                return a * x + b
+
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        cf = CurveFit(Model(), x, 2 * x + 1, p0=[1.0, 0.0]).fit()
+        assert cf.covariance.shape == (2, 2)
+        assert np.allclose(cf.params, [2.0, 1.0])
+
+    def test_refit_keeps_previous_results(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        cf = CurveFit(linear_func, x, 2 * x + 1).fit()
+        params, covariance = cf.params, cf.covariance
+        expected = params.copy()
+        cf.y = 3 * x - 1
+        cf.fit()
+        assert np.allclose(params, expected)
+        assert covariance is not cf.covariance
+        assert np.allclose(cf.params, [3.0, -1.0])
+
+    def test_fit_failure_warns_once_per_instance(self):
+        def failing_func(x, a):
+            raise RuntimeError("boom")
+
+        x = np.array([1, 2, 3])
+        y = np.array([2, 4, 6])
+        cf = CurveFit(failing_func, x, y)
+        with pytest.warns(UserWarning, match="Curve fitting failed"):
+            cf.fit()
+        assert not cf.fitted
+        with pytest.raises(NotFittedError):
+            _ = cf.params
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cf.fit()
+        with pytest.warns(UserWarning, match="Curve fitting failed"):
+            CurveFit(failing_func, x, y).fit()
+
+    def test_fit_failure_silent(self):
+        def failing_func(x, a):
+            raise RuntimeError("boom")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CurveFit(failing_func, [1, 2, 3], [2, 4, 6], silent=True).fit()
+
+    def test_str_format(self):
+        x = np.array([1, 2, 3, 4])
+        y = np.array([3, 5, 7, 9])
+        cf = CurveFit(linear_func, x, y).fit()
+        expected = (
+            f"params=[{cf.params[0]:g}, {cf.params[1]:g}], "
+            f"stderr=[{cf.stderr[0]:g}, {cf.stderr[1]:g}]"
+        )
+        assert expected in str(cf)
@@ -1,59 +1,168 @@
+import pickle
+from decimal import Decimal
+import numpy as np
 import pytest
-from lab_tools.file_io import PICKLE, JSON, TXT
+from lab_tools import file_io
+from lab_tools.file_io import PICKLE, JSON, TXT, MSGPACK, NPY
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory, request):
+    return tmp_path_factory.mktemp(request.cls.__name__)
+
+
+@pytest.fixture
+def file_stem(class_tmp, request):
+    return class_tmp / request.node.name
 
 
 class TestPickle:
-    def test_pickle_dump_and_load(self, tmp_path):
+    def test_pickle_dump_and_load(self, file_stem):
         data = {"key": "value", "number": 42}
-        file_path = tmp_path / "test.pkl"
+        file_path = file_stem.with_suffix(".pkl")
         PICKLE.dump(file_path, data)
         loaded_data = PICKLE.load(file_path)
         assert loaded_data == data
 
-    def test_pickle_dump_invalid_extension(self, tmp_path):
+    def test_pickle_numpy_standard_format(self, file_stem):
+        data = {"array": np.arange(1_000_000, dtype=np.float64), "label": "x"}
+        file_path = file_stem.with_suffix(".pkl")
+        PICKLE.dump(file_path, data)
+        with open(file_path, "rb") as f:
+            loaded_data = pickle.load(f)
+        assert loaded_data["label"] == "x"
+        assert np.array_equal(loaded_data["array"], data["array"])
+        assert loaded_data["array"].flags.writeable
+
+    def test_pickle_dump_invalid_extension(self, file_stem):
         data = [1, 2, 3]
-        file_path = tmp_path / "test.txt"  # Złe rozszerzenie
+        file_path = file_stem.with_suffix(".txt")  # Złe rozszerzenie
         with pytest.raises(ValueError, match="Invalid file type: expected '.pkl'"):
             PICKLE.dump(file_path, data)
 
 
 class TestJSON:
-    def test_json_dump_and_load(self, tmp_path):
+    def test_json_dump_and_load(self, file_stem):
         data = {"name": "test", "value": 123}
-        file_path = tmp_path / "test.json"
+        file_path = file_stem.with_suffix(".json")
         JSON.dump(file_path, data)
         loaded_data = JSON.load(file_path)
         assert loaded_data == data
 
-    def test_json_dump_invalid_data_type(self, tmp_path):
+    @pytest.mark.parametrize("backend", ["orjson", "ujson", "json"])
+    def test_json_backends(self, file_stem, monkeypatch, backend):
+        if backend != "json":
+            pytest.importorskip(backend)
+        if backend != "orjson":
+            monkeypatch.setattr(file_io, "orjson", None)
+        if backend == "json":
+            monkeypatch.setattr(file_io, "ujson", None)
+        data = {"path": "a/b", "values": [1, 2.5], "nested": {"ok": True}}
+        file_path = file_stem.with_suffix(".json")
+        JSON.dump(file_path, data)
+        assert JSON.load(file_path) == data
+
+        data = {"nan": float("nan"), "inf": float("-inf"), "big": 2**70}
+        JSON.dump(file_path, data)
+        loaded_data = JSON.load(file_path)
+        assert loaded_data["nan"] != loaded_data["nan"]
+        assert loaded_data["inf"] == float("-inf")
+        assert loaded_data["big"] == 2**70 and isinstance(loaded_data["big"], int)
+
+    @pytest.mark.parametrize("backend", ["ujson", "json"])
+    @pytest.mark.parametrize(
+        "data", [{(1, 2): 1}, {"value": Decimal("1.1")}], ids=["tuple_key", "decimal"]
+    )
+    def test_json_dump_rejects_non_json_types(
+        self, file_stem, monkeypatch, backend, data
+    ):
+        if backend == "ujson":
+            pytest.importorskip("ujson")
+        else:
+            monkeypatch.setattr(file_io, "ujson", None)
+        file_path = file_stem.with_suffix(".json")
+        with pytest.raises(TypeError):
+            JSON.dump(file_path, data)
+
+    def test_json_load_nan_literal(self, file_stem):
+        file_path = file_stem.with_suffix(".json")
+        file_path.write_text('{"value": NaN}', encoding="utf-8")
+        loaded_data = JSON.load(file_path)
+        assert loaded_data["value"] != loaded_data["value"]
+
+    def test_json_dump_invalid_data_type(self, file_stem):
         data = "not a dict"
-        file_path = tmp_path / "test.json"
+        file_path = file_stem.with_suffix(".json")
         with pytest.raises(TypeError, match="Invalid data type: expected dict"):
             JSON.dump(file_path, data)  # type: ignore
 
-    def test_json_dump_invalid_extension(self, tmp_path):
+    def test_json_dump_invalid_extension(self, file_stem):
         data = {"key": "value"}
-        file_path = tmp_path / "test.pkl"  # Złe rozszerzenie
+        file_path = file_stem.with_suffix(".pkl")  # Złe rozszerzenie
         with pytest.raises(ValueError, match="Invalid file type: expected '.json'"):
             JSON.dump(file_path, data)
 
 
 class TestTXT:
-    def test_txt_dump_and_load(self, tmp_path):
+    def test_txt_dump_and_load(self, file_stem):
         data = "Hello, world!"
-        file_path = tmp_path / "test.txt"
+        file_path = file_stem.with_suffix(".txt")
         TXT.dump(file_path, data)
         loaded_data = TXT.load(file_path)
         assert loaded_data == data
 
-    def test_txt_dump_invalid_data_type(self, tmp_path):
+    def test_txt_load_normalizes_newlines(self, file_stem):
+        file_path = file_stem.with_suffix(".txt")
+        file_path.write_bytes("zażółć\r\ngęślą\rjaźń\n".encode("utf-8"))
+        assert TXT.load(file_path) == "zażółć\ngęślą\njaźń\n"
+
+    def test_txt_dump_invalid_data_type(self, file_stem):
         data = 123  # Nie str
-        file_path = tmp_path / "test.txt"
+        file_path = file_stem.with_suffix(".txt")
         with pytest.raises(TypeError, match="Invalid data type: expected str"):
             TXT.dump(file_path, data)  # type: ignore
 
-    def test_txt_dump_invalid_extension(self, tmp_path):
+    def test_txt_dump_invalid_extension(self, file_stem):
         data = "text"
-        file_path = tmp_path / "test.json"  # Złe rozszerzenie
+        file_path = file_stem.with_suffix(".json")  # Złe rozszerzenie
         with pytest.raises(ValueError, match="Invalid file type: expected '.txt'"):
             TXT.dump(file_path, data)
+
+
+class TestMSGPACK:
+    def test_msgpack_dump_and_load(self, file_stem):
+        pytest.importorskip("msgpack")
+        data = {"name": "test", "values": [1, 2.5, "x"], "raw": b"\x00\x01"}
+        file_path = file_stem.with_suffix(".msgpack")
+        MSGPACK.dump(file_path, data)
+        loaded_data = MSGPACK.load(file_path)
+        assert loaded_data == data
+
+    def test_msgpack_non_str_keys(self, file_stem):
+        pytest.importorskip("msgpack")
+        data = {1: "a", 2.5: "b", "c": {3: None}}
+        file_path = file_stem.with_suffix(".msgpack")
+        MSGPACK.dump(file_path, data)
+        assert MSGPACK.load(file_path) == data
+
+    def test_msgpack_dump_invalid_extension(self, file_stem):
+        pytest.importorskip("msgpack")
+        data = {"key": "value"}
+        file_path = file_stem.with_suffix(".json")  # Złe rozszerzenie
+        with pytest.raises(ValueError, match="Invalid file type: expected '.msgpack'"):
+            MSGPACK.dump(file_path, data)
+
+
+class TestNPY:
+    def test_npy_dump_and_load(self, file_stem):
+        data = np.linspace(0.0, 1.0, 1000)
+        file_path = file_stem.with_suffix(".npy")
+        NPY.dump(file_path, data)
+        loaded_data = NPY.load(file_path)
+        assert np.array_equal(loaded_data, data)
+
+    def test_npy_dump_invalid_extension(self, file_stem):
+        data = np.zeros(3)
+        file_path = file_stem.with_suffix(".pkl")  # Złe rozszerzenie
+        with pytest.raises(ValueError, match="Invalid file type: expected '.npy'"):
+            NPY.dump(file_path, data)
@@ -1,17 +1,21 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import linregress
 
 from lab_tools.exceptions import NotFittedError
 from lab_tools.linear_regression import LinearRegression
 
 
-@pytest.fixture
-def simple_linear_data():
-    np.random.seed(0)
-    x = np.linspace(-10, 10, 50)
-    y = 3.0 * x + 2.0 + np.random.normal(scale=0.5, size=len(x))
-    return x, y
+def _close(a, b, *, rtol=1e-5, atol=1e-8):
+    # same tolerance rule as np.isclose, without ufunc dispatch for scalars
+    return abs(a - b) <= atol + rtol * abs(b)
+
+
+@pytest.fixture(scope="module")
+def fitted_reg(simple_linear_data):
+    x, y = simple_linear_data
+    return LinearRegression(x, y).fit()
 
 
 def test_init_accepts_arraylike(simple_linear_data):
@@ -21,6 +25,17 @@ def test_init_accepts_arraylike(simple_linear_data):
     assert isinstance(reg.y, np.ndarray)
 
 
+def test_init_reuses_float_arrays():
+    x = np.linspace(0.0, 1.0, 20)
+    y = 2.0 * x
+    reg = LinearRegression(x, y)
+    assert reg.x is x and reg.y is y
+
+    strided = LinearRegression(x[::2], y[::2]).fit()
+    assert strided.x.flags.c_contiguous
+    assert _close(strided.slope, 2.0)
+
+
 def test_init_rejects_non_1d():
     x = np.array([[1, 2, 3]])
     y = np.array([1, 2, 3])
@@ -44,9 +59,8 @@ def test_init_limits_validation(simple_linear_data):
         LinearRegression(x, y, limits=(1.0,))  # type: ignore
 
 
-def test_fit_basic_properties(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_fit_basic_properties(fitted_reg):
+    reg = fitted_reg
 
     assert np.isfinite(reg.slope)
     assert np.isfinite(reg.intercept)
@@ -55,12 +69,45 @@ def test_fit_basic_properties(simple_linear_data):
     assert -1.0 <= reg.rvalue <= 1.0
 
 
-def test_fit_recovers_parameters(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_fit_recovers_parameters(fitted_reg):
+    reg = fitted_reg
+
+    assert _close(reg.slope, 3.0, atol=0.1)
+    assert _close(reg.intercept, 2.0, atol=0.3)
+
+
+@pytest.mark.parametrize("force_zero", [False, True])
+def test_rvalue_clipped_on_exact_data(force_zero):
+    x = np.linspace(0.1, 10.0, 37)
+    y = 3.0 * x + (0.0 if force_zero else 2.0)
+    reg = LinearRegression(x, y, force_zero=force_zero).fit()
+
+    assert -1.0 <= reg.rvalue <= 1.0
+    assert reg.to_dataframe().loc["x", "r_squared"] <= 1.0
+    assert _close(reg.rvalue, 1.0)
+
+
+@pytest.mark.parametrize("force_zero", [False, True])
+@pytest.mark.parametrize("noise", [0.0, 1e-7, 1e-6])
+def test_stderr_on_well_fitted_data(force_zero, noise):
+    rng = np.random.RandomState(1)
+    x = np.linspace(-5.0, 5.0, 100)
+    y = 3.0 * x + (0.0 if force_zero else 2.0) + rng.normal(scale=noise, size=100)
+    reg = LinearRegression(x, y, force_zero=force_zero).fit()
 
-    assert np.isclose(reg.slope, 3.0, atol=0.1)
-    assert np.isclose(reg.intercept, 2.0, atol=0.3)
+    # two-pass reference from explicit residuals
+    if force_zero:
+        residuals = y - reg.slope * x
+        expected = np.sqrt(residuals @ residuals / (len(x) - 1) / (x @ x))
+    else:
+        xc = x - x.mean()
+        residuals = y - reg.slope * x - reg.intercept
+        expected = np.sqrt(residuals @ residuals / (len(x) - 2) / (xc @ xc))
+
+    if noise == 0.0:
+        assert reg.stderr < 1e-14
+    else:
+        assert _close(reg.stderr, expected, rtol=1e-6, atol=0.0)
 
 
 def test_force_zero(simple_linear_data):
@@ -69,20 +116,19 @@ def test_force_zero(simple_linear_data):
 
     assert reg.intercept == 0.0
     assert reg.intercept_stderr == 0.0
-    assert np.isclose(reg.slope, 3.0, atol=0.3)
+    assert _close(reg.slope, 3.0, atol=0.3)
+    assert _close(reg.rvalue, (x @ y) / np.sqrt((x @ x) * (y @ y)))
 
 
-def test_predict_y(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_predict_y(fitted_reg):
+    reg = fitted_reg
 
     y_pred = reg.predict_y([0.0, 1.0])
     assert np.allclose(y_pred, reg.slope * np.array([0.0, 1.0]) + reg.intercept)
 
 
-def test_predict_x(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_predict_x(fitted_reg):
+    reg = fitted_reg
 
     y_test = np.array([2.0, 5.0])
     x_pred = reg.predict_x(y_test)
@@ -90,6 +136,15 @@ def test_predict_x(simple_linear_data):
     assert np.allclose(reg.predict_y(x_pred), y_test)
 
 
+def test_predict_x_zero_slope():
+    x = np.array([1.0, 2.0, 3.0])
+    reg = LinearRegression(x, np.array([1.0, 3.0, 1.0])).fit()
+
+    assert reg.slope == 0.0
+    assert reg.predict_x(3.0) == np.inf
+    assert np.array_equal(reg.predict_x([1.0, 3.0]), [-np.inf, np.inf])
+
+
 def test_predict_raises_if_not_fitted():
     x = np.array([1.0, 2.0, 3.0])
     y = np.array([1.0, 2.0, 3.0])
@@ -105,19 +160,17 @@ def test_predict_raises_if_not_fitted():
         reg.to_dataframe()
 
 
-def test_iter_protocol(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_iter_protocol(fitted_reg):
+    reg = fitted_reg
 
     values = list(reg)
-    assert len(values) == 5
+    assert len(values) == len(reg) == 5
     assert values[0] == reg.slope
     assert values[1] == reg.intercept
 
 
-def test_str_and_repr(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_str_and_repr(fitted_reg):
+    reg = fitted_reg
 
     s = str(reg)
     r = repr(reg)
@@ -126,9 +179,8 @@ def test_str_and_repr(simple_linear_data):
     assert s == r
 
 
-def test_to_dataframe(simple_linear_data):
-    x, y = simple_linear_data
-    reg = LinearRegression(x, y).fit()
+def test_to_dataframe(fitted_reg):
+    reg = fitted_reg
 
     df = reg.to_dataframe()
 
@@ -139,4 +191,91 @@ def test_to_dataframe(simple_linear_data):
     assert "r_squared" in df.columns
     assert "rvalue" in df.columns
 
-    assert np.isclose(pd.to_numeric(df.loc["x", "r_squared"]), reg.rvalue**2)
+    assert _close(pd.to_numeric(df.loc["x", "r_squared"]), reg.rvalue**2)
+
+
+def test_fit_matches_linregress(simple_linear_data):
+    x, y = simple_linear_data
+    reg = LinearRegression(x + 100.0, y).fit()
+    ref = linregress(x + 100.0, y)
+
+    assert _close(reg.slope, ref.slope)
+    assert _close(reg.intercept, ref.intercept)
+    assert _close(reg.stderr, ref.stderr)
+    assert _close(reg.intercept_stderr, ref.intercept_stderr)
+    assert _close(reg.rvalue, ref.rvalue)
+
+
+def test_fit_large_offset_matches_linregress(simple_linear_data):
+    x, y = simple_linear_data
+    x = 1e8 + x / 1e3
+    reg = LinearRegression(x, y).fit()
+    ref = linregress(x, y)
+
+    assert _close(reg.slope, ref.slope, rtol=1e-6)
+    assert _close(reg.stderr, ref.stderr, rtol=1e-6)
+    assert _close(reg.rvalue, ref.rvalue, rtol=1e-9)
+
+
+def test_fit_line_grid(simple_linear_data):
+    x, y = simple_linear_data
+    reg = LinearRegression(x, y, limits=(-5.0, 5.0)).fit()
+
+    assert reg.x_fit.shape == reg.y_fit.shape == (50,)
+    assert reg.x_fit[0] == -5.0 and reg.x_fit[-1] == 5.0
+    assert np.allclose(reg.y_fit, reg.predict_y(reg.x_fit))
+
+
+def test_refit_keeps_previous_results(simple_linear_data):
+    x, y = simple_linear_data
+    reg = LinearRegression(x, y).fit()
+    x_fit, y_fit = reg.x_fit, reg.y_fit
+    expected = y_fit.copy()
+
+    reg.y = 5 * reg.x
+    reg.fit()
+    assert np.array_equal(y_fit, expected)
+    assert x_fit is not reg.x_fit
+    assert np.allclose(reg.y_fit, 5 * reg.x_fit)
+
+
+def test_predict_scalar(fitted_reg):
+    reg = fitted_reg
+
+    y_pred = reg.predict_y(1.5)
+    assert isinstance(y_pred, float)
+    assert _close(y_pred, reg.predict_y([1.5])[0])
+    assert _close(reg.predict_x(y_pred), 1.5)
+
+
+def test_to_dataframe_cached_until_refit(simple_linear_data):
+    x, y = simple_linear_data
+    reg = LinearRegression(x, y).fit()
+
+    df = reg.to_dataframe()
+    assert reg.to_dataframe() is df
+
+    reg.fit()
+    assert reg.to_dataframe() is not df
+
+
+@pytest.mark.parametrize("force_zero", [False, True])
+def test_fit_many_matches_single_fits(simple_linear_data, force_zero):
+    x, y = simple_linear_data
+    X = np.stack([x, x + 1.0, 2.0 * x])
+    Y = np.stack([y, 0.5 * y - 1.0, y[::-1]])
+
+    df = LinearRegression.fit_many(X, Y, force_zero=force_zero)
+
+    assert len(df) == 3
+    for i in range(3):
+        reg = LinearRegression(X[i], Y[i], force_zero=force_zero).fit()
+        assert np.allclose(df.iloc[i].to_numpy(), list(reg))
+
+
+def test_fit_many_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        LinearRegression.fit_many([1.0, 2.0, 3.0], [1.0, 2.0, 3.0])
+
+    with pytest.raises(ValueError):
+        LinearRegression.fit_many(np.ones((2, 3)), np.ones((3, 3)))
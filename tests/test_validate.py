@@ -35,6 +35,14 @@ class TestValidate:
             ValueError, match="Limits must be a sequence of two numeric values"
         ):
             Validate.limits_type((1.0, "b"))
+        with pytest.raises(
+            ValueError, match="Limits must be a sequence of two numeric values"
+        ):
+            Validate.limits_type((True, False))
+        with pytest.raises(
+            ValueError, match="Limits must be a sequence of two numeric values"
+        ):
+            Validate.limits_type([[1.0, 2.0]])
 
     def test_is_1d_array_valid(self):
         Validate.is_1d_array([1, 2, 3])
@@ -57,10 +65,23 @@ class TestValidate:
         with pytest.raises(ValueError, match="Input arrays must have the same length"):
             Validate.arrays_same_length(np.array([1]), np.array([2, 3]))
 
+    def test_xy_arrays_valid(self):
+        x, y = Validate.xy_arrays([1, 2, 3], np.array([4.0, 5.0, 6.0]))
+        assert x.dtype == np.float64 and y.dtype == np.float64
+        assert np.array_equal(x, [1.0, 2.0, 3.0])
+
+    def test_xy_arrays_invalid(self):
+        with pytest.raises(ValueError, match="Input arrays must be one-dimensional"):
+            Validate.xy_arrays([[1, 2], [3, 4]], [1, 2])
+        with pytest.raises(ValueError, match="Input arrays must have the same length"):
+            Validate.xy_arrays([1, 2], [3, 4, 5])
+
     def test_file_extension_valid(self):
         Validate.file_extension("file.csv", ".csv")
         Validate.file_extension("FILE.TXT", ".txt")  # Wielkość liter ignorowana
         Validate.file_extension("/path/to/file.json", ".JSON")
+        Validate.file_extension(b"file.csv", ".csv")
+        Validate.file_extension("archive.tar.gz", ".tar.gz")
 
     def test_file_extension_invalid_no_dot(self):
         with pytest.raises(ValueError, match="expected_ext must start with '.'"):
@@ -78,6 +99,12 @@ class TestValidate:
         ):
             Validate.file_extension("file", ".csv")
 
+    def test_file_extension_dotted_directory(self):
+        with pytest.raises(
+            ValueError, match="Invalid file type: expected '.csv', got '<no extension>'"
+        ):
+            Validate.file_extension("data.v2/file", ".csv")
+
     def test_file_extension_file_descriptor(self):
         # Dla deskryptora pliku (int), metoda nie robi nic
         Validate.file_extension(0, ".csv")  # Nie powinno rzucić wyjątku